@@ -15,6 +15,8 @@ import pytest
 import numpy as np
 
 import odl
+from odl.tomo.util.numba_utils import (
+    NUMBA_AVAILABLE, axis_rotation_matrix_numba)
 from odl.util.testutils import all_almost_equal, all_equal, simple_fixture
 
 
@@ -37,6 +39,8 @@ axis = simple_fixture('axis', det_pos_init_3d_params)
 shift = simple_fixture('shift', [0, 1])
 detector_type = simple_fixture('detector_type',
                                ['flat', 'cylindrical', 'spherical'])
+curved_detector_type = simple_fixture('detector_type',
+                                      ['cylindrical', 'spherical'])
 
 
 # --- tests --- #
@@ -291,6 +295,128 @@ def test_parallel_3d_orientation(axis):
     assert repr(geom)
 
 
+def test_axis_rotation_matrix_vectorized(axis):
+    """Check vectorized evaluation of axis-oriented rotation matrices."""
+    apart = odl.uniform_partition(0, 2 * np.pi, 10)
+    dpart = odl.uniform_partition([0, 0], [1, 1], (10, 10))
+    geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart, axis=axis)
+
+    angles = geom.angles
+    matrices = geom.rotation_matrix(angles)
+    assert matrices.shape == (angles.size, 3, 3)
+    for angle, matrix in zip(angles, matrices):
+        assert all_almost_equal(matrix, geom.rotation_matrix(angle))
+        assert all_almost_equal(
+            matrix, odl.tomo.axis_rotation_matrix(geom.axis, angle))
+
+    # Arbitrary shapes of angle arrays are supported
+    angles = np.random.uniform(0, 2 * np.pi, size=(4, 5))
+    matrices = geom.rotation_matrix(angles)
+    assert matrices.shape == (4, 5, 3, 3)
+    assert all_almost_equal(matrices[2, 3],
+                            geom.rotation_matrix(angles[2, 3]))
+
+
+def test_axis_rotation_matrix_cache():
+    """Check memoization of axis-oriented rotation matrices."""
+    apart = odl.uniform_partition(0, np.pi, 10)
+    dpart = odl.uniform_partition([0, 0], [1, 1], (10, 10))
+    geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart, axis=[1, 1, 0])
+
+    # Evaluation at the motion grid and at single angles is cached
+    matrices = geom.rotation_matrix(geom.angles)
+    assert geom.rotation_matrix(geom.angles) is matrices
+    angle = geom.angles[3]
+    matrix = geom.rotation_matrix(angle)
+    assert geom.rotation_matrix(angle) is matrix
+    assert all_almost_equal(matrix, matrices[3])
+
+    # Cached results must not be modified
+    with pytest.raises(ValueError):
+        matrix[0, 0] = 0
+    with pytest.raises(ValueError):
+        matrices[0, 0, 0] = 0
+
+    # Other arrays are not cached, and invalid angles are still detected
+    assert geom.rotation_matrix(geom.angles.copy()) is not matrices
+    with pytest.raises(ValueError):
+        geom.rotation_matrix(2 * np.pi)
+
+    # A failed bounds check is not memoized, so it fails again
+    memo = geom.implementation_cache['rotation_matrix'][geom.dtype]
+    assert 2 * np.pi not in memo
+    with pytest.raises(ValueError):
+        geom.rotation_matrix(2 * np.pi)
+
+
+def test_axis_rotation_matrix_dtype(axis):
+    """Check single precision rotation matrices."""
+    apart = odl.uniform_partition(0, np.pi, 10)
+    dpart = odl.uniform_partition([-1, -1], [1, 1], (10, 10))
+    geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=1000,
+                                     det_radius=500, axis=axis)
+    geom_32 = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=1000,
+                                        det_radius=500, axis=axis,
+                                        dtype='float32')
+    assert geom.dtype == 'float64'
+    assert geom_32.dtype == 'float32'
+    assert geom_32[::2].dtype == 'float32'
+
+    for angle in [0.5, geom.angles, np.zeros((4, 5))]:
+        matrix = geom_32.rotation_matrix(angle)
+        assert matrix.dtype == 'float32'
+        assert all_almost_equal(matrix, geom.rotation_matrix(angle),
+                                ndigits=6)
+
+    # Single precision results are cached like double precision ones
+    matrices = geom_32.rotation_matrix(geom_32.angles)
+    assert geom_32.rotation_matrix(geom_32.angles) is matrices
+    assert not matrices.flags.writeable
+    assert geom_32.rotation_matrix(0.5) is geom_32.rotation_matrix(0.5)
+
+    # Source and detector vectors are computed in double precision
+    angles = geom.angles
+    dparams = (np.linspace(-1, 1, 5)[None, :, None],
+               np.linspace(-1, 1, 5)[None, None, :])
+    assert all_almost_equal(geom_32.src_position(angles),
+                            geom.src_position(angles))
+    assert all_almost_equal(geom_32.det_refpoint(angles),
+                            geom.det_refpoint(angles))
+    assert all_almost_equal(geom_32.det_axes(angles), geom.det_axes(angles))
+    angles = angles[:, None, None]
+    assert all_almost_equal(geom_32.det_point_position(angles, dparams),
+                            geom.det_point_position(angles, dparams))
+
+    with pytest.raises(ValueError):
+        odl.tomo.Parallel3dAxisGeometry(apart, dpart, dtype=int)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba not available')
+def test_axis_rotation_matrix_numba(axis):
+    """Compare the compiled rotation matrix kernel to the NumPy version."""
+    norm_axis = np.array(axis, dtype=float) / np.linalg.norm(axis)
+    angles = np.random.uniform(-np.pi, np.pi, size=20)
+    out = np.empty((20, 3, 3))
+    matrices = axis_rotation_matrix_numba(norm_axis, angles, out)
+    assert matrices is out
+    assert all_almost_equal(
+        matrices, odl.tomo.axis_rotation_matrix(norm_axis, angles))
+
+
+def test_axis_rotation_matrix_numpy(axis, monkeypatch):
+    """Check the NumPy fallback for stacks of rotation matrices."""
+    monkeypatch.setattr(odl.tomo.util.numba_utils, 'NUMBA_AVAILABLE', False)
+    apart = odl.uniform_partition(0, 2 * np.pi, 10)
+    dpart = odl.uniform_partition([0, 0], [1, 1], (10, 10))
+    geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart, axis=axis)
+
+    for shape in [(1,), (5,), (3, 4), (2, 1, 3)]:
+        angles = np.random.uniform(0, 2 * np.pi, size=shape)
+        assert all_almost_equal(
+            geom.rotation_matrix(angles),
+            odl.tomo.axis_rotation_matrix(geom.axis, angles))
+
+
 def test_parallel_3d_slanted_detector():
     """Check if non-standard detector axes are handled correctly."""
     full_angle = np.pi
@@ -848,6 +974,95 @@ def test_conebeam_source_detector_shifts():
                             geom_ds.src_position(geom_ds.angles))
 
 
+def test_cone_beam_det_point_position_outer(detector_type):
+    """Check "outer product" evaluation of detector points on the grids."""
+    apart = odl.uniform_partition(0, 2 * np.pi, 7)
+    dpart = odl.uniform_partition([-1, -1], [1, 1], (4, 5))
+    if detector_type == 'spherical':
+        curve_rad = [20, 20]
+    elif detector_type == 'cylindrical':
+        curve_rad = [20, None]
+    else:
+        curve_rad = None
+    geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=10,
+                                     det_radius=5, pitch=2,
+                                     det_curvature_radius=curve_rad)
+
+    # Broadcasting motion and detector parameters against each other
+    # gives all combinations of angles and detector points
+    angles = geom.angles[:, None, None]
+    dparams = (geom.det_grid.coord_vectors[0][None, :, None],
+               geom.det_grid.coord_vectors[1][None, None, :])
+    positions = geom.det_point_position(angles, dparams)
+    assert positions.shape == (7, 4, 5, 3)
+
+    for i, angle in enumerate(geom.angles):
+        for j, k in product(range(4), range(5)):
+            dparam = geom.det_grid[j, k]
+            assert all_almost_equal(positions[i, j, k],
+                                    geom.det_point_position(angle, dparam))
+
+    # Same for the (normalized) vectors from detector points to the source
+    vecs = geom.det_to_src(angles, dparams, normalized=False)
+    assert all_almost_equal(vecs,
+                            geom.src_position(angles) - positions)
+    dirs = geom.det_to_src(angles, dparams)
+    assert all_almost_equal(dirs,
+                            vecs / np.linalg.norm(vecs, axis=-1)[..., None])
+
+
+def test_curved_detector_outer(curved_detector_type):
+    """Check "outer product" evaluation on curved detector surfaces."""
+    part = odl.uniform_partition([-np.pi / 3, -np.pi / 4],
+                                 [np.pi / 3, np.pi / 4], (4, 5))
+    if curved_detector_type == 'cylindrical':
+        det_cls = odl.tomo.CylindricalDetector
+    else:
+        det_cls = odl.tomo.SphericalDetector
+    det = det_cls(part, axes=[(1, 0, 0), (0, 0, 1)], radius=2)
+
+    a, b = part.coord_vectors
+    param = (a[:, None], b[None, :])
+    surf = det.surface(param)
+    derivs = det.surface_deriv(param)
+    normals = det.surface_normal(param)
+    assert surf.shape == (4, 5, 3)
+    assert derivs.shape == (4, 5, 2, 3)
+    assert normals.shape == (4, 5, 3)
+
+    for i, j in product(range(4), range(5)):
+        point = [a[i], b[j]]
+        assert all_almost_equal(surf[i, j], det.surface(point))
+        assert all_almost_equal(derivs[i, j], det.surface_deriv(point))
+        assert all_almost_equal(normals[i, j], det.surface_normal(point))
+
+
+def test_cone_beam_det_to_src_single_rotation():
+    """Check that ``det_to_src`` computes the rotation matrices once."""
+    apart = odl.uniform_partition(0, 2 * np.pi, 7)
+    dpart = odl.uniform_partition([-1, -1], [1, 1], (4, 5))
+    geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=10,
+                                     det_radius=5, axis=[1, 1, 0])
+
+    angles = np.linspace(0.1, 1, 6)
+    vecs = geom.det_to_src(angles, [0, 0], normalized=False)
+
+    calls = []
+    rotation_matrix_unchecked = geom._rotation_matrix_unchecked
+
+    def counting_rotation_matrix(angle):
+        calls.append(angle)
+        return rotation_matrix_unchecked(angle)
+
+    geom._rotation_matrix_unchecked = counting_rotation_matrix
+    assert all_equal(geom.det_to_src(angles, [0, 0], normalized=False), vecs)
+    assert len(calls) == 1
+
+    # Angles are still validated
+    with pytest.raises(ValueError):
+        geom.det_to_src(angles + 2 * np.pi, [0, 0])
+
+
 def test_cone_beam_slanted_detector():
     """Check if non-standard detector axes are handled correctly."""
     full_angle = np.pi
@@ -1008,6 +1223,73 @@ def test_helical_geometry_helper():
     assert geometry.det_partition.cell_sides[1] <= delta_h
 
 
+def test_vectorized_trajectories():
+    """Check that source and detector trajectories are vectorized."""
+    apart_1d = odl.uniform_partition(0, np.pi, 6)
+    apart_2d = odl.uniform_partition([0, 0], [np.pi, np.pi], (3, 2))
+    dpart_1d = odl.uniform_partition(-1, 1, 10)
+    dpart_2d = odl.uniform_partition([-1, -1], [1, 1], (10, 10))
+    geometries = [
+        odl.tomo.Parallel2dGeometry(apart_1d, dpart_1d),
+        odl.tomo.Parallel3dEulerGeometry(apart_2d, dpart_2d),
+        odl.tomo.Parallel3dAxisGeometry(apart_1d, dpart_2d, axis=[1, 1, 0]),
+        odl.tomo.ParallelHoleCollimatorGeometry(apart_1d, dpart_2d,
+                                                det_radius=5),
+        odl.tomo.FanBeamGeometry(apart_1d, dpart_1d, src_radius=5,
+                                 det_radius=10),
+        odl.tomo.ConeBeamGeometry(apart_1d, dpart_2d, src_radius=5,
+                                  det_radius=10, pitch=2),
+    ]
+
+    for geom in geometries:
+        shape = geom.motion_grid.shape
+        if geom.motion_params.ndim == 1:
+            mparams = geom.motion_grid.coord_vectors[0]
+            single_mparams = list(mparams)
+        else:
+            mparams = geom.motion_grid.meshgrid
+            single_mparams = [tuple(pt) for pt in geom.motion_grid.points()]
+
+        funcs = [geom.det_refpoint]
+        if isinstance(geom, odl.tomo.DivergentBeamGeometry):
+            funcs.append(geom.src_position)
+
+        for func in funcs:
+            points = func(mparams)
+            assert points.shape == shape + (geom.ndim,)
+            true_points = [func(mparam) for mparam in single_mparams]
+            assert all_almost_equal(points.reshape(-1, geom.ndim),
+                                    true_points)
+
+
+def test_geometry_grid():
+    """Check the joined grid for uniform and non-uniform sampling."""
+    apart_uni = odl.uniform_partition(0, np.pi, 10)
+    apart_nonuni = odl.nonuniform_partition([0, 0.5, 1.5, 3.0],
+                                            min_pt=0, max_pt=np.pi)
+    dpart_uni = odl.uniform_partition([-1, -1], [1, 1], (4, 5))
+    dpart_nonuni = odl.nonuniform_partition([-1, 0, 0.5, 1], [-1, 0, 1])
+
+    for apart, dpart in product([apart_uni, apart_nonuni],
+                                [dpart_uni, dpart_nonuni]):
+        geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart)
+        grid = geom.grid
+        assert grid == geom.partition.grid
+        assert grid.ndim == 3
+        assert grid.shape == apart.shape + dpart.shape
+        assert all_equal(grid.coord_vectors[0],
+                         geom.motion_grid.coord_vectors[0])
+        for vec, det_vec in zip(grid.coord_vectors[1:],
+                                geom.det_grid.coord_vectors):
+            assert all_equal(vec, det_vec)
+
+        # The joined objects are cached
+        assert geom.grid is grid
+        assert geom.params == geom.partition.set
+        assert geom.params is geom.params
+        assert geom.partition is geom.partition
+
+
 def test_source_detector_shifts():
     """Test source-detector shift functions, e.g. flying focal spot.
 
@@ -802,6 +802,10 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
             If ``True``, methods computing vectors check input arguments.
             Checks are vectorized and add only a small overhead.
             Default: ``True``
+        dtype : optional
+            Real floating point data type of the matrices returned by
+            `rotation_matrix`.
+            Default: ``'float64'``
 
         Notes
         -----
@@ -979,7 +983,8 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         # Initialize stuff
         self.__src_to_det_init = src_to_det_init
-        AxisOrientedGeometry.__init__(self, axis)
+        dtype = kwargs.pop('dtype', 'float64')
+        AxisOrientedGeometry.__init__(self, axis, dtype)
         # `check_bounds` is needed for both detector and geometry
         check_bounds = kwargs.get('check_bounds', True)
         if det_curvature_radius is None:
@@ -1228,7 +1233,7 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
             axes_enumeration = np.moveaxis(deriv, -2, 0)
         """
         # Transpose to take dot along axis 1
-        axes = self.rotation_matrix(angle).dot(self.det_axes_init.T)
+        axes = self._rotation_matrix(angle).dot(self.det_axes_init.T)
         # `axes` has shape (a, 3, 2), need to roll the last dimensions
         # to the second-to-last place
         return np.rollaxis(axes, -1, -2)
@@ -1311,7 +1316,14 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         """
         squeeze_out = (np.shape(angle) == ())
         angle = np.array(angle, dtype=float, copy=False, ndmin=1)
-        rot_matrix = self.rotation_matrix(angle)
+        refpt = self._det_refpoint(angle, self._rotation_matrix(angle))
+        if squeeze_out:
+            refpt = refpt.squeeze()
+
+        return refpt
+
+    def _det_refpoint(self, angle, rot_matrix):
+        """Return `det_refpoint` for validated rotation matrices."""
         extra_dims = angle.ndim
         det_shifts = np.array(self.det_shift_func(angle), dtype=float, ndmin=2)
 
@@ -1344,9 +1356,6 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         refpt = (self.translation[transl_slc]
                  + circle_component
                  + pitch_component)
-        if squeeze_out:
-            refpt = refpt.squeeze()
-
         return refpt
 
     def src_position(self, angle):
@@ -1428,7 +1437,14 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         """
         squeeze_out = (np.shape(angle) == ())
         angle = np.array(angle, dtype=float, copy=False, ndmin=1)
-        rot_matrix = self.rotation_matrix(angle)
+        refpt = self._src_position(angle, self._rotation_matrix(angle))
+        if squeeze_out:
+            refpt = refpt.squeeze()
+
+        return refpt
+
+    def _src_position(self, angle, rot_matrix):
+        """Return `src_position` for validated rotation matrices."""
         extra_dims = angle.ndim
         src_shifts = self.src_shift_func(angle)
 
@@ -1461,9 +1477,6 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         refpt = (self.translation[transl_slc]
                  + circle_component
                  + pitch_component)
-        if squeeze_out:
-            refpt = refpt.squeeze()
-
         return refpt
 
     def __repr__(self):
@@ -1540,11 +1553,13 @@ class ConeBeamGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
                                 det_axes_init=self._det_axes_init_arg,
                                 src_shift_func=self.src_shift_func,
                                 det_shift_func=self.det_shift_func,
-                                translation=self.translation)
+                                translation=self.translation,
+                                dtype=self.dtype)
 
-    # Manually override the abstract method in `Geometry` since it's found
+    # Manually override the methods in `Geometry` since they're found
     # first
     rotation_matrix = AxisOrientedGeometry.rotation_matrix
+    _rotation_matrix = AxisOrientedGeometry._rotation_matrix
 
 
 def cone_beam_geometry(space, src_radius, det_radius, num_angles=None,
@@ -10,11 +10,13 @@
 
 from __future__ import print_function, division, absolute_import
 from builtins import object
+import math
 import numpy as np
 
 from odl.discr import RectPartition
 from odl.tomo.geometry.detector import Detector
-from odl.tomo.util import axis_rotation_matrix, is_inside_bounds
+from odl.tomo.util import is_inside_bounds
+from odl.util import is_real_floating_dtype
 
 
 __all__ = ('Geometry', 'DivergentBeamGeometry', 'AxisOrientedGeometry')
@@ -145,7 +147,12 @@ class Geometry(object):
 
         A `RectPartition` with `det_partition` appended to `motion_partition`.
         """
-        return self.motion_partition.append(self.det_partition)
+        try:
+            return self.implementation_cache['partition']
+        except KeyError:
+            partition = self.motion_partition.append(self.det_partition)
+            self.implementation_cache['partition'] = partition
+            return partition
 
     @property
     def params(self):
@@ -154,7 +161,13 @@ class Geometry(object):
         By convention, the motion parameters come before the detector
         parameters.
         """
-        return self.partition.set
+        # Joining the sets directly avoids building the joined partition
+        try:
+            return self.implementation_cache['params']
+        except KeyError:
+            params = self.motion_params.append(self.det_params)
+            self.implementation_cache['params'] = params
+            return params
 
     @property
     def grid(self):
@@ -162,7 +175,15 @@ class Geometry(object):
 
         By convention, the motion grid comes before the detector grid.
         """
-        return self.partition.grid
+        # Joining the grids directly avoids building the joined partition.
+        # Geometries are immutable, so the result can be cached, as for
+        # `partition` and `params`.
+        try:
+            return self.implementation_cache['grid']
+        except KeyError:
+            grid = self.motion_grid.append(self.det_grid)
+            self.implementation_cache['grid'] = grid
+            return grid
 
     @property
     def translation(self):
@@ -193,6 +214,15 @@ class Geometry(object):
         point : `numpy.ndarray`
             Vector(s) pointing from the origin to the detector reference
             point at ``mparam``.
+
+        Notes
+        -----
+        Implementations must be vectorized, i.e., accept stacks of
+        parameters and return an array of shape
+        ``bcast_mparam.shape + (ndim,)``, where ``bcast_mparam`` is
+        ``mparam`` if `motion_params` is 1D and ``broadcast(*mparam)``
+        otherwise. Methods like `det_point_position` rely on this to
+        evaluate all parameters in a single call.
         """
         raise NotImplementedError('abstract method')
 
@@ -239,6 +269,14 @@ class Geometry(object):
         """
         raise NotImplementedError('abstract method')
 
+    def _rotation_matrix(self, mparam):
+        """Return the rotation matrix at ``mparam`` in double precision.
+
+        This is used internally for computing positions and axes. By
+        default, it is the same as `rotation_matrix`.
+        """
+        return self.rotation_matrix(mparam)
+
     def det_point_position(self, mparam, dparam):
         """Return the detector point at ``(mparam, dparam)``.
 
@@ -358,12 +396,12 @@ class Geometry(object):
         if self.motion_params.ndim == 1:
             squeeze_mparam = (np.shape(mparam) == ())
             mparam = np.array(mparam, dtype=float, copy=False, ndmin=1)
-            matrix = self.rotation_matrix(mparam)  # shape (m, ndim, ndim)
+            matrix = self._rotation_matrix(mparam)  # shape (m, ndim, ndim)
         else:
             squeeze_mparam = (np.broadcast(*mparam).shape == ())
             mparam = tuple(np.array(a, dtype=float, copy=False, ndmin=1)
                            for a in mparam)
-            matrix = self.rotation_matrix(mparam)  # shape (m, ndim, ndim)
+            matrix = self._rotation_matrix(mparam)  # shape (m, ndim, ndim)
 
         if self.det_params.ndim == 1:
             squeeze_dparam = (np.shape(dparam) == ())
@@ -373,6 +411,29 @@ class Geometry(object):
             dparam = tuple(np.array(p, dtype=float, copy=False, ndmin=1)
                            for p in dparam)
 
+        det_pt_pos = self._det_point_position(mparam, dparam, matrix)
+        if squeeze_mparam and squeeze_dparam:
+            det_pt_pos = det_pt_pos.squeeze()
+
+        return det_pt_pos
+
+    def _det_point_position(self, mparam, dparam, matrix):
+        """Return `det_point_position` for validated rotation matrices.
+
+        Parameters
+        ----------
+        mparam : `numpy.ndarray` or tuple of `numpy.ndarray`
+            Motion parameter(s) with at least 1 dimension.
+        dparam : `numpy.ndarray` or tuple of `numpy.ndarray`
+            Detector parameter(s) with at least 1 dimension.
+        matrix : `numpy.ndarray`
+            Double precision rotation matrices at ``mparam``.
+
+        Returns
+        -------
+        pos : `numpy.ndarray`
+            Unsqueezed detector point position(s).
+        """
         surf = self.detector.surface(dparam)  # shape (d, ndim)
 
         # Perform matrix-vector multiplication along the last axis of both
@@ -386,15 +447,35 @@ class Geometry(object):
         matrix_axes = list(range(matrix.ndim))
         surf_axes = list(range(matrix.ndim - 2)) + [matrix_axes[-1]]
         out_axes = list(range(matrix.ndim - 1))
-        det_part = np.einsum(matrix, matrix_axes, surf, surf_axes, out_axes)
-
-        refpt = self.det_refpoint(mparam)
-        det_pt_pos = refpt + det_part
-        if squeeze_mparam and squeeze_dparam:
-            det_pt_pos = det_pt_pos.squeeze()
+        det_pt_pos = np.einsum(matrix, matrix_axes, surf, surf_axes,
+                               out_axes)
 
+        # The result already has the full broadcast shape, hence the
+        # reference point can be added in place
+        det_pt_pos += self._det_refpoint(mparam, matrix)
         return det_pt_pos
 
+    def _det_refpoint(self, mparam, matrix):
+        """Return `det_refpoint` for validated rotation matrices.
+
+        Implementations can override this method to reuse ``matrix``
+        instead of validating ``mparam`` and computing the rotation
+        matrices again. By default, `det_refpoint` is called.
+
+        Parameters
+        ----------
+        mparam : `numpy.ndarray` or tuple of `numpy.ndarray`
+            Motion parameter(s) with at least 1 dimension.
+        matrix : `numpy.ndarray`
+            Double precision rotation matrices at ``mparam``.
+
+        Returns
+        -------
+        point : `numpy.ndarray`
+            Unsqueezed detector reference point(s).
+        """
+        return self.det_refpoint(mparam)
+
     @property
     def implementation_cache(self):
         """Dictionary acting as a cache for this geometry.
@@ -433,9 +514,36 @@ class DivergentBeamGeometry(Geometry):
         -------
         pos : `numpy.ndarray`
             Vector(s) pointing from the origin to the source.
+
+        Notes
+        -----
+        Like `Geometry.det_refpoint`, implementations must be vectorized
+        in ``angle``, since `det_to_src` evaluates all angles in a single
+        call.
         """
         raise NotImplementedError('abstract method')
 
+    def _src_position(self, angle, matrix):
+        """Return `src_position` for validated rotation matrices.
+
+        Implementations can override this method to reuse ``matrix``
+        instead of validating ``angle`` and computing the rotation
+        matrices again. By default, `src_position` is called.
+
+        Parameters
+        ----------
+        angle : `numpy.ndarray` or tuple of `numpy.ndarray`
+            Motion parameter(s) with at least 1 dimension.
+        matrix : `numpy.ndarray`
+            Double precision rotation matrices at ``angle``.
+
+        Returns
+        -------
+        pos : `numpy.ndarray`
+            Unsqueezed source position(s).
+        """
+        return self.src_position(angle)
+
     def det_to_src(self, angle, dparam, normalized=True):
         """Vector or direction from a detector location to the source.
 
@@ -535,6 +643,10 @@ class DivergentBeamGeometry(Geometry):
             angle = tuple(np.array(a, dtype=float, copy=False, ndmin=1)
                           for a in angle)
 
+        # Validate the angles and compute the rotation matrices only once
+        # for detector points and source positions
+        matrix = self._rotation_matrix(angle)
+
         if self.det_params.ndim == 1:
             squeeze_dparam = (np.shape(dparam) == ())
             dparam = np.array(dparam, dtype=float, copy=False, ndmin=1)
@@ -543,11 +655,17 @@ class DivergentBeamGeometry(Geometry):
             dparam = tuple(np.array(p, dtype=float, copy=False, ndmin=1)
                            for p in dparam)
 
-        det_to_src = (self.src_position(angle) -
-                      self.det_point_position(angle, dparam))
+        # The detector points have the full broadcast shape of `angle` and
+        # `dparam`, so we can subtract them from the source positions in
+        # place
+        det_to_src = self._det_point_position(angle, dparam, matrix)
+        np.subtract(self._src_position(angle, matrix), det_to_src,
+                    out=det_to_src)
 
         if normalized:
-            det_to_src /= np.linalg.norm(det_to_src, axis=-1, keepdims=True)
+            # Squared norms via `einsum` need no temporary of full size
+            sq_norm = np.einsum('...i,...i->...', det_to_src, det_to_src)
+            det_to_src /= np.sqrt(sq_norm)[..., None]
 
         if squeeze_angle and squeeze_dparam:
             det_to_src = det_to_src.squeeze()
@@ -559,29 +677,65 @@ class AxisOrientedGeometry(object):
 
     """Mixin class for 3d geometries oriented along an axis."""
 
-    def __init__(self, axis):
+    def __init__(self, axis, dtype='float64'):
         """Initialize a new instance.
 
         Parameters
         ----------
         axis : `array-like`, shape ``(3,)``
             Vector defining the fixed rotation axis of this geometry.
+        dtype : optional
+            Real floating point data type of the matrices returned by
+            `rotation_matrix`. Using ``'float32'`` halves the size of
+            the returned and cached stacks of matrices. Source and
+            detector positions and axes are computed from double
+            precision matrices regardless of this choice.
         """
-        axis = np.asarray(axis, dtype=float)
+        dtype, dtype_in = np.dtype(dtype), dtype
+        if not is_real_floating_dtype(dtype):
+            raise ValueError('`dtype` must be a real floating point type, '
+                             'got {!r}'.format(dtype_in))
+        self.__dtype = dtype
+
+        # Copy once and normalize in place, the input must not be changed
+        axis = np.array(axis, dtype=float)
         if axis.shape != (3,):
             raise ValueError('`axis.shape` must be (3,), got {}'
                              ''.format(axis.shape))
 
-        if np.linalg.norm(axis) == 0:
+        norm = math.sqrt(axis[0] * axis[0] + axis[1] * axis[1]
+                         + axis[2] * axis[2])
+        if norm == 0:
             raise ValueError('`axis` cannot be zero')
 
-        self.__axis = axis / np.linalg.norm(axis)
+        axis /= norm
+        self.__axis = axis
+
+        # Axis-dependent matrices in Rodrigues' rotation formula
+        self.__dy_mat = axis[:, None] * axis[None, :]
+        self.__cross_mat = np.array([[0, -axis[2], axis[1]],
+                                     [axis[2], 0, -axis[0]],
+                                     [-axis[1], axis[0], 0]])
+
+        # For rotations around a (signed) coordinate axis, which is by far
+        # the most common case, the matrix only has a 2x2 rotation block.
+        # We store the axis index and the orientation in that case.
+        nonzero = np.flatnonzero(axis)
+        if len(nonzero) == 1:
+            self.__coord_axis = (int(nonzero[0]), float(axis[nonzero[0]]))
+        else:
+            self.__coord_axis = None
 
     @property
     def axis(self):
         """Normalized axis of rotation, a 3d vector."""
         return self.__axis
 
+    @property
+    def dtype(self):
+        """Data type of the rotation matrices of this geometry."""
+        return self.__dtype
+
     def rotation_matrix(self, angle):
         """Return the rotation matrix to the system state at ``angle``.
 
@@ -604,18 +758,136 @@ class AxisOrientedGeometry(object):
             coordinate system.
             If ``angle`` is a single parameter, the returned array has
             shape ``(3, 3)``, otherwise ``angle.shape + (3, 3)``.
+            The data type of the array is `dtype`.
+            Results for single angles and for the angles of `motion_grid`
+            are cached and returned as read-only arrays.
+        """
+        return self._rotation_matrix(angle, self.dtype)
+
+    def _rotation_matrix(self, angle, dtype=np.dtype('float64')):
+        """Return the rotation matrix at ``angle`` with data type ``dtype``.
+
+        This is `rotation_matrix` with a free choice of data type. It is
+        used with the default double precision for computing source and
+        detector positions and axes. Results are cached separately for
+        each data type.
         """
         squeeze_out = (np.shape(angle) == ())
+
+        # Matrices for single angles and for the whole motion grid are
+        # requested over and over again, e.g., by backends setting up
+        # projection geometries. Cached entries have already passed the
+        # bounds check.
+        memo = self.implementation_cache.setdefault(
+            'rotation_matrix', {}).setdefault(dtype, {})
+        if squeeze_out:
+            # Python floats and `numpy.float64` (a subclass of `float`)
+            # can be used as keys directly
+            memo_key = angle if isinstance(angle, float) else float(angle)
+        elif angle is self.motion_grid.coord_vectors[0]:
+            memo_key = 'motion_grid'
+        else:
+            memo_key = None
+
+        if memo_key is not None:
+            try:
+                return memo[memo_key]
+            except KeyError:
+                pass
+
         angle = np.array(angle, dtype=float, copy=False, ndmin=1)
         if (self.check_bounds and
                 not is_inside_bounds(angle, self.motion_params)):
             raise ValueError('`angle` {} not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
-        matrix = axis_rotation_matrix(self.axis, angle)
+        matrix = self._rotation_matrix_unchecked(angle)
+        if dtype != matrix.dtype:
+            matrix = matrix.astype(dtype)
+
         if squeeze_out:
             matrix = matrix.squeeze()
 
+        # Limit the number of cached single angles to the grid size to
+        # avoid unbounded growth when evaluating at arbitrary angles
+        if (memo_key == 'motion_grid' or
+                memo_key is not None and len(memo) <= self.motion_grid.size):
+            matrix.flags.writeable = False
+            memo[memo_key] = matrix
+
+        return matrix
+
+    def _rotation_matrix_unchecked(self, angle):
+        """Return the rotation matrices at ``angle`` without any checks.
+
+        This is the computational part of `rotation_matrix` for callers
+        that have already validated their input.
+
+        Parameters
+        ----------
+        angle : `numpy.ndarray`
+            Float array of angles in radians, with at least 1 dimension.
+
+        Returns
+        -------
+        rot : `numpy.ndarray`
+            The double precision rotation matrices, of shape
+            ``angle.shape + (3, 3)``.
+        """
+        shape = angle.shape + (3, 3)
+        if angle.size == 1:
+            # For a single angle, the `math` functions are much faster
+            # than the ufuncs
+            cos_ang = math.cos(angle.item())
+            sin_ang = math.sin(angle.item())
+        else:
+            # Numba is imported lazily since importing it is slow
+            from odl.tomo.util.numba_utils import (
+                NUMBA_AVAILABLE, axis_rotation_matrix_numba)
+
+            if NUMBA_AVAILABLE and self.__coord_axis is None:
+                # Stacks of angles are handled by a compiled kernel
+                matrix = np.empty(shape)
+                axis_rotation_matrix_numba(self.axis, angle.ravel(),
+                                           matrix.reshape(-1, 3, 3))
+                return matrix
+
+            cos_ang = np.cos(angle)
+            sin_ang = np.sin(angle)
+
+        if self.__coord_axis is not None:
+            # The rotation acts on the 2 other coordinates, in cyclic order
+            # to get the correct orientation
+            k, sign = self.__coord_axis
+            i, j = (k + 1) % 3, (k + 2) % 3
+            if sign < 0:
+                sin_ang = -sin_ang
+            matrix = np.zeros(shape)
+            matrix[..., i, i] = cos_ang
+            matrix[..., i, j] = -sin_ang
+            matrix[..., j, i] = sin_ang
+            matrix[..., j, j] = cos_ang
+            matrix[..., k, k] = 1
+            return matrix
+
+        # Angle arrays get shape (..., 1, 1) to broadcast against the
+        # matrices, resulting in `angle.shape + (3, 3)`. Python floats
+        # broadcast by themselves.
+        if angle.size == 1:
+            cos_diag = cos_ang
+        else:
+            cos_ang = cos_ang[..., None, None]
+            sin_ang = sin_ang[..., None, None]
+            cos_diag = cos_ang[..., 0]
+
+        # Assemble `cos * I + (1 - cos) * dy_mat + sin * cross_mat` in
+        # place to keep the number of full-size temporaries low. The
+        # identity part is added to a writable view of the diagonal.
+        matrix = np.multiply(1. - cos_ang, self.__dy_mat,
+                             out=np.empty(shape))
+        matrix += np.multiply(sin_ang, self.__cross_mat)
+        diag = np.einsum('...ii->...i', matrix)
+        diag += cos_diag
         return matrix
 
 
@@ -169,30 +169,31 @@ class ParallelBeamGeometry(Geometry):
         if self.motion_params.ndim == 1:
             squeeze_out = (np.shape(angle) == ())
             angle = np.array(angle, dtype=float, copy=False, ndmin=1)
-            rot_matrix = self.rotation_matrix(angle)
-            extra_dims = angle.ndim
         elif self.motion_params.ndim in (2, 3):
             squeeze_out = (np.broadcast(*angle).shape == ())
             angle = tuple(np.array(a, dtype=float, copy=False, ndmin=1)
                           for a in angle)
-            rot_matrix = self.rotation_matrix(angle)
-            extra_dims = len(np.broadcast(*angle).shape)
         else:
             raise NotImplementedError(
                 'no default implementation available for `det_refpoint` '
                 'with `motion_params.ndim == {}`'
                 ''.format(self.motion_params.ndim))
 
-        rot_part = rot_matrix.dot(self.det_pos_init - self.translation)
-
-        # Broadcast along extra dimensions
-        pt_slc = (None,) * extra_dims + (slice(None),)
-        refpoint = self.translation[pt_slc] + rot_part
+        refpoint = self._det_refpoint(angle, self._rotation_matrix(angle))
         if squeeze_out:
             refpoint = refpoint.squeeze()
 
         return refpoint
 
+    def _det_refpoint(self, angle, rot_matrix):
+        """Return `det_refpoint` for validated rotation matrices."""
+        rot_part = rot_matrix.dot(self.det_pos_init - self.translation)
+
+        # Broadcast along the extra dimensions of the matrices
+        extra_dims = rot_matrix.ndim - 2
+        pt_slc = (None,) * extra_dims + (slice(None),)
+        return self.translation[pt_slc] + rot_part
+
     def det_to_src(self, angle, dparam):
         """Direction from a detector location to the source.
 
@@ -289,12 +290,12 @@ class ParallelBeamGeometry(Geometry):
         if self.motion_params.ndim == 1:
             squeeze_angle = (np.shape(angle) == ())
             angle = np.array(angle, dtype=float, copy=False, ndmin=1)
-            matrix = self.rotation_matrix(angle)  # shape (m, ndim, ndim)
+            matrix = self._rotation_matrix(angle)  # shape (m, ndim, ndim)
         else:
             squeeze_angle = (np.broadcast(*angle).shape == ())
             angle = tuple(np.array(a, dtype=float, copy=False, ndmin=1)
                           for a in angle)
-            matrix = self.rotation_matrix(angle)  # shape (m, ndim, ndim)
+            matrix = self._rotation_matrix(angle)  # shape (m, ndim, ndim)
 
         if self.det_params.ndim == 1:
             squeeze_dparam = (np.shape(dparam) == ())
@@ -1122,6 +1123,10 @@ class Parallel3dAxisGeometry(ParallelBeamGeometry, AxisOrientedGeometry):
             If ``True``, methods computing vectors check input arguments.
             Checks are vectorized and add only a small overhead.
             Default: ``True``
+        dtype : optional
+            Real floating point data type of the matrices returned by
+            `rotation_matrix`.
+            Default: ``'float64'``
 
         Notes
         -----
@@ -1241,7 +1246,8 @@ class Parallel3dAxisGeometry(ParallelBeamGeometry, AxisOrientedGeometry):
         # Initialize stuff. Normalization of the detector axis happens in
         # the detector class. `check_bounds` is needed for both detector
         # and geometry.
-        AxisOrientedGeometry.__init__(self, axis)
+        dtype = kwargs.pop('dtype', 'float64')
+        AxisOrientedGeometry.__init__(self, axis, dtype)
         check_bounds = kwargs.get('check_bounds', True)
         detector = Flat2dDetector(dpart, axes=det_axes_init,
                                   check_bounds=check_bounds)
@@ -1397,7 +1403,7 @@ class Parallel3dAxisGeometry(ParallelBeamGeometry, AxisOrientedGeometry):
         (4, 5, 2, 3)
         """
         # Transpose to take dot along axis 1
-        axes = self.rotation_matrix(angle).dot(self.det_axes_init.T)
+        axes = self._rotation_matrix(angle).dot(self.det_axes_init.T)
         # `axes` has shape (a, 3, 2), need to roll the last dimensions
         # to the second to last place
         return np.rollaxis(axes, -1, -2)
@@ -1461,11 +1467,13 @@ class Parallel3dAxisGeometry(ParallelBeamGeometry, AxisOrientedGeometry):
                                       axis=self.axis,
                                       det_pos_init=self._det_pos_init_arg,
                                       det_axes_init=self._det_axes_init_arg,
-                                      translation=self.translation)
+                                      translation=self.translation,
+                                      dtype=self.dtype)
 
-    # Manually override the abstract method in `Geometry` since it's found
+    # Manually override the methods in `Geometry` since they're found
     # first
     rotation_matrix = AxisOrientedGeometry.rotation_matrix
+    _rotation_matrix = AxisOrientedGeometry._rotation_matrix
 
 
 def parallel_beam_geometry(space, num_angles=None, det_shape=None):
@@ -58,6 +58,10 @@ class ParallelHoleCollimatorGeometry(Parallel3dAxisGeometry):
             If ``True``, methods perform sanity checks on provided input
             parameters.
             Default: ``True``
+        dtype : optional
+            Real floating point data type of the matrices returned by
+            `rotation_matrix`.
+            Default: ``'float64'``
 
         Notes
         -----
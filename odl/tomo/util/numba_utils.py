@@ -0,0 +1,86 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Optional compiled kernels for tomographic geometries.
+
+The kernels in this module are compiled with `Numba
+<https://numba.pydata.org/>`_ if it is installed. Since importing Numba is
+expensive, this module is not imported by default but only when needed.
+"""
+
+from __future__ import print_function, division, absolute_import
+import math
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+__all__ = ('NUMBA_AVAILABLE', 'axis_rotation_matrix_numba')
+
+
+def _axis_rotation_matrix_kernel(axis, angles, out):
+    """Write Rodrigues' rotation matrices for ``angles`` to ``out``.
+
+    Parameters
+    ----------
+    axis : `numpy.ndarray`, shape ``(3,)``
+        Rotation axis, assumed to be a unit vector.
+    angles : `numpy.ndarray`, shape ``(N,)``
+        Angles of counter-clockwise rotation.
+    out : `numpy.ndarray`, shape ``(N, 3, 3)``
+        Array to which the matrices are written.
+    """
+    ax, ay, az = axis[0], axis[1], axis[2]
+    for i in numba.prange(angles.shape[0]):
+        cos_ang = math.cos(angles[i])
+        sin_ang = math.sin(angles[i])
+        one_m_cos = 1.0 - cos_ang
+        out[i, 0, 0] = cos_ang + ax * ax * one_m_cos
+        out[i, 0, 1] = ax * ay * one_m_cos - az * sin_ang
+        out[i, 0, 2] = ax * az * one_m_cos + ay * sin_ang
+        out[i, 1, 0] = ay * ax * one_m_cos + az * sin_ang
+        out[i, 1, 1] = cos_ang + ay * ay * one_m_cos
+        out[i, 1, 2] = ay * az * one_m_cos - ax * sin_ang
+        out[i, 2, 0] = az * ax * one_m_cos - ay * sin_ang
+        out[i, 2, 1] = az * ay * one_m_cos + ax * sin_ang
+        out[i, 2, 2] = cos_ang + az * az * one_m_cos
+
+
+if NUMBA_AVAILABLE:
+    _axis_rotation_matrix_kernel = numba.njit(parallel=True, cache=True)(
+        _axis_rotation_matrix_kernel)
+
+
+def axis_rotation_matrix_numba(axis, angles, out):
+    """Compute rotation matrices around ``axis`` with a compiled kernel.
+
+    The matrices are computed according to `Rodrigues' rotation formula
+    <https://en.wikipedia.org/wiki/Rodrigues'_rotation_formula>`_, with
+    all 9 entries written directly for each angle. This avoids the
+    temporary arrays created by the equivalent NumPy expression.
+
+    Parameters
+    ----------
+    axis : `numpy.ndarray`, shape ``(3,)``
+        Rotation axis, assumed to be a unit vector.
+    angles : `numpy.ndarray`, shape ``(N,)``
+        Angles of counter-clockwise rotation.
+    out : `numpy.ndarray`, shape ``(N, 3, 3)``
+        Array to which the matrices are written.
+
+    Returns
+    -------
+    out : `numpy.ndarray`, shape ``(N, 3, 3)``
+        The ``out`` array, filled with the rotation matrices.
+    """
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError('Numba is not available')
+    _axis_rotation_matrix_kernel(axis, angles, out)
+    return out
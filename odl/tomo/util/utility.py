@@ -224,7 +224,7 @@ def axis_rotation_matrix(axis, angle):
     cross_mat = np.array([[0, -axis[2], axis[1]],
                           [axis[2], 0, -axis[0]],
                           [-axis[1], axis[0], 0]])
-    dy_mat = np.outer(axis, axis)
+    dy_mat = axis[:, None] * axis[None, :]
     id_mat = np.eye(3)
     cos_ang = np.cos(angle)
     sin_ang = np.sin(angle)